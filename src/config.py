@@ -175,11 +175,16 @@ SITE1_CONTENT_EXCLUDE_HTML_CLASS_SUBSTRINGS: List[str] = [
     c.strip() for c in _SITE1_CONTENT_EXCLUDE_CLASS_RAW.split(",") if c.strip()
 ]
 
+# Site1 content tracker: pages already in the snapshot are re-fetched only once their
+# last scan is older than this many hours; URLs new to the sitemap are always fetched.
+# Override via env var SITE1_CONTENT_FULL_RESCAN_HOURS (0 = fetch every page on every run).
+SITE1_CONTENT_FULL_RESCAN_HOURS = max(0.0, float(os.environ.get("SITE1_CONTENT_FULL_RESCAN_HOURS", "24")))
+
 # Path to store snapshots
 SNAPSHOTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "snapshots")
 
 # Keys to ignore when comparing (these change frequently but aren't meaningful)
-IGNORE_KEYS = [
+IGNORE_KEYS = frozenset({
     "__N_SSP",
     "__N_SSG", 
     "isFallback",
@@ -198,17 +203,17 @@ IGNORE_KEYS = [
     "sessionId",
     "sessionToken",
     "requestId",
-]
+})
 
 # Keys that contain timestamps or session data (normalize these)
-TIMESTAMP_KEYS = [
+TIMESTAMP_KEYS = frozenset({
     "createdAt",
     "updatedAt", 
     "lastModified",
     "timestamp",
     "_updatedAt",
     "_createdAt",
-]
+})
 
 # YouTube Channel ID to track (Dr. Joe Dispenza)
 # RSS Feed URL: https://www.youtube.com/feeds/videos.xml?channel_id=UCSTTPGPS-lm0YVb4DMJ3lTA
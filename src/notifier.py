@@ -1,13 +1,110 @@
 ﻿# Discord Notification Module
 
 import json
+import threading
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import urllib.request
 import urllib.error
 
 from config import DISCORD_MAX_CHANGES
 
+# Discord accepts at most 10 embeds per webhook message, with at most 6000
+# characters of embed text across all of them.
+_DISCORD_MAX_EMBEDS_PER_MESSAGE = 10
+_DISCORD_MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+_active_batcher: Optional["NotificationBatcher"] = None
+
+
+class NotificationBatcher:
+    """
+    Collect webhook embeds while active and post them together on flush(),
+    packing as many embeds into each message as Discord allows, instead of
+    one POST per notification.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, List[Tuple[Dict[str, Any], str]]] = {}
+        self._lock = threading.Lock()
+
+    def activate(self) -> "NotificationBatcher":
+        """Route embed notifications into this batch until flush()."""
+        global _active_batcher
+        _active_batcher = self
+        return self
+
+    def add(self, webhook_url: str, embeds: List[Dict[str, Any]], label: str) -> None:
+        with self._lock:
+            self._pending.setdefault(webhook_url, []).extend((embed, label) for embed in embeds)
+
+    def flush(self) -> bool:
+        """Stop batching and post everything queued. Returns True if all posts succeeded."""
+        global _active_batcher
+        if _active_batcher is self:
+            _active_batcher = None
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        all_sent = True
+        for webhook_url, queued in pending.items():
+            for chunk in _chunk_embeds(queued):
+                label = ", ".join(dict.fromkeys(label for _, label in chunk))
+                if not _post_embeds(webhook_url, [embed for embed, _ in chunk], label):
+                    all_sent = False
+        return all_sent
+
+
+def _embed_text_length(embed: Dict[str, Any]) -> int:
+    """Characters Discord counts towards the per-message embed limit."""
+    length = len(embed.get("title") or "") + len(embed.get("description") or "")
+    length += len((embed.get("footer") or {}).get("text") or "")
+    length += len((embed.get("author") or {}).get("name") or "")
+    for embed_field in embed.get("fields") or []:
+        length += len(embed_field.get("name") or "") + len(embed_field.get("value") or "")
+    return length
+
+
+def _chunk_embeds(
+    queued: List[Tuple[Dict[str, Any], str]]
+) -> List[List[Tuple[Dict[str, Any], str]]]:
+    """
+    Split queued embeds into messages within Discord's count and size limits.
+    Discord merges embeds sharing a "url" within one message into a single gallery
+    embed (dropping all but the first one's text), so those go to separate messages.
+    """
+    chunks: List[List[Tuple[Dict[str, Any], str]]] = []
+    current: List[Tuple[Dict[str, Any], str]] = []
+    current_length = 0
+    current_urls: set = set()
+    for item in queued:
+        length = _embed_text_length(item[0])
+        url = item[0].get("url")
+        if current and (
+            len(current) >= _DISCORD_MAX_EMBEDS_PER_MESSAGE
+            or current_length + length > _DISCORD_MAX_EMBED_CHARS_PER_MESSAGE
+            or (url and url in current_urls)
+        ):
+            chunks.append(current)
+            current, current_length, current_urls = [], 0, set()
+        current.append(item)
+        current_length += length
+        if url:
+            current_urls.add(url)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _send_embeds(webhook_url: str, embeds: List[Dict[str, Any]], label: str) -> bool:
+    """Queue embeds on the active batch, or post them right away if none is active."""
+    batcher = _active_batcher
+    if batcher is not None:
+        batcher.add(webhook_url, embeds, label)
+        return True
+    return _post_embeds(webhook_url, embeds, label)
+
+
 def send_discord_notification(
     webhook_url: str,
     title: str,
@@ -55,8 +152,13 @@ def send_discord_notification(
         }
     }
     
+    return _send_embeds(webhook_url, [embed], title)
+
+
+def _post_embeds(webhook_url: str, embeds: List[Dict[str, Any]], label: str) -> bool:
+    """POST one webhook message carrying the given embeds."""
     payload = {
-        "embeds": [embed]
+        "embeds": embeds
     }
     
     try:
@@ -73,7 +175,7 @@ def send_discord_notification(
         
         with urllib.request.urlopen(req, timeout=30) as response:
             if response.status in (200, 204):
-                print(f"✅ Discord notification sent: {title}")
+                print(f"✅ Discord notification sent: {label}")
                 return True
             else:
                 print(f"❌ Discord returned status {response.status}")
@@ -100,6 +202,10 @@ def _post_discord_payload(
         print("âš ï¸  No Discord webhook URL configured")
         return False
 
+    # Embed-only payloads can share a message with other notifications.
+    if _active_batcher is not None and set(payload) == {"embeds"}:
+        return _send_embeds(webhook_url, payload["embeds"], success_label)
+
     try:
         data = json.dumps(payload).encode("utf-8")
         req = urllib.request.Request(
@@ -526,37 +632,8 @@ def send_new_youtube_video_notification(
         
         embeds.append(embed)
     
-    payload = {"embeds": embeds}
-    
-    try:
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            webhook_url,
-            data=data,
-            headers={
-                "Content-Type": "application/json",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            },
-            method="POST"
-        )
-        
-        with urllib.request.urlopen(req, timeout=30) as response:
-            if response.status in (200, 204):
-                print(f"✅ YouTube notification sent: {len(videos)} new video(s)")
-                return True
-            else:
-                print(f"❌ Discord returned status {response.status}")
-                return False
-                
-    except urllib.error.HTTPError as e:
-        print(f"❌ Discord HTTP error: {e.code} - {e.reason}")
-        return False
-    except urllib.error.URLError as e:
-        print(f"❌ Discord URL error: {e.reason}")
-        return False
-    except Exception as e:
-        print(f"❌ Discord error: {e}")
-        return False
+    # Goes through the run's notification batch like every other embed.
+    return _send_embeds(webhook_url, embeds, f"YouTube: {len(videos)} new video(s)")
 
 
 def _truncate(text: str, max_length: int) -> str:
@@ -752,37 +829,8 @@ def send_new_youtube_video_notification(
         
         embeds.append(embed)
     
-    payload = {"embeds": embeds}
-    
-    try:
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            webhook_url,
-            data=data,
-            headers={
-                "Content-Type": "application/json",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            },
-            method="POST"
-        )
-        
-        with urllib.request.urlopen(req, timeout=30) as response:
-            if response.status in (200, 204):
-                print(f"✅ YouTube notification sent: {len(videos)} new video(s)")
-                return True
-            else:
-                print(f"❌ Discord returned status {response.status}")
-                return False
-                
-    except urllib.error.HTTPError as e:
-        print(f"❌ Discord HTTP error: {e.code} - {e.reason}")
-        return False
-    except urllib.error.URLError as e:
-        print(f"❌ Discord URL error: {e.reason}")
-        return False
-    except Exception as e:
-        print(f"❌ Discord error: {e}")
-        return False
+    # Goes through the run's notification batch like every other embed.
+    return _send_embeds(webhook_url, embeds, f"YouTube: {len(videos)} new video(s)")
 
 
 def _truncate(text: str, max_length: int) -> str: